@@ -0,0 +1,215 @@
+import numpy as np
+
+
+def symboles_ordonnes(automate):
+    """
+    Retourne la liste triée des symboles de l'automate (symbole vide compris).
+
+    L'indice d'un symbole dans cette liste est le chiffre utilisé pour le coder
+    dans l'écriture en base |S| d'une configuration.
+    """
+    return sorted(set(automate.espace_etat) | {automate.symbol_vide})
+
+
+def encoder_configuration(mot, symboles):
+    """
+    Code une configuration (suite de symboles) par un entier en base |S|.
+    La première cellule correspond au chiffre de poids fort, de sorte que l'ordre
+    des codes est l'ordre lexicographique des mots.
+
+    Args:
+        mot (iterable): Les symboles de la configuration (ex : "0110" ou ['0', '1']).
+        symboles (list): Les symboles ordonnés (voir symboles_ordonnes).
+
+    Returns:
+        int: Le code de la configuration.
+    """
+    indice = {s: i for i, s in enumerate(symboles)}
+    code = 0
+    for s in mot:
+        code = code * len(symboles) + indice[s]
+    return code
+
+
+def decoder_configuration(code, largeur, symboles):
+    """
+    Opération inverse de encoder_configuration.
+
+    Returns:
+        list: Les symboles des `largeur` cellules de la configuration.
+    """
+    k = len(symboles)
+    cellules = []
+    for _ in range(largeur):
+        code, chiffre = divmod(code, k)
+        cellules.append(symboles[chiffre])
+    return cellules[::-1]
+
+
+def _table_locale(automate, symboles):
+    """
+    Construit la règle locale sous forme de tableau : la case g*k*k + c*k + d
+    contient l'indice du nouvel état de la cellule centrale.
+    """
+    k = len(symboles)
+    table = np.empty(k ** 3, dtype=np.min_scalar_type(k - 1))
+    for g in range(k):
+        for c in range(k):
+            for d in range(k):
+                nouvel_etat = automate.prochaine_etat(symboles[g], symboles[c], symboles[d])
+                table[(g * k + c) * k + d] = symboles.index(nouvel_etat)
+    return table
+
+
+def _chiffres(codes, largeur, k):
+    """
+    Décompose un lot de codes en `largeur` tableaux de chiffres
+    (le chiffre d'indice 0 est celui de la première cellule).
+    """
+    reste = codes.copy()
+    chiffres = [None] * largeur
+    for i in range(largeur - 1, -1, -1):
+        chiffres[i] = reste % k
+        reste //= k
+    return chiffres
+
+
+def _lots(nombre_etats, taille_lot):
+    """
+    Découpe l'intervalle [0, nombre_etats) en lots de codes consécutifs.
+    """
+    for debut in range(0, nombre_etats, taille_lot):
+        yield np.arange(debut, min(debut + taille_lot, nombre_etats), dtype=np.int64)
+
+
+def calcule_successeurs(automate, largeur, taille_lot=1 << 20):
+    """
+    Calcule la configuration suivante de toutes les configurations de largeur
+    donnée sur un tore (la cellule 0 est voisine de la cellule largeur - 1).
+
+    Les configurations sont codées par des entiers (voir encoder_configuration)
+    et traitées par lots vectorisés de `taille_lot` codes.
+
+    Args:
+        automate (Automate_cellulaire): L'automate à étudier.
+        largeur (int): Le nombre de cellules du tore.
+        taille_lot (int, optional): Nombre de configurations traitées à la fois.
+
+    Returns:
+        numpy.ndarray: Le tableau `successeurs`, où successeurs[x] est le code
+        de la configuration obtenue après un pas de calcul depuis x.
+    """
+    if largeur < 1:
+        raise ValueError("La largeur du tore doit être au moins 1")
+
+    symboles = symboles_ordonnes(automate)
+    k = len(symboles)
+    nombre_etats = k ** largeur
+    table = _table_locale(automate, symboles)
+    successeurs = np.empty(nombre_etats, dtype=np.min_scalar_type(nombre_etats - 1))
+
+    for codes in _lots(nombre_etats, taille_lot):
+        chiffres = _chiffres(codes, largeur, k)
+        suivant = np.zeros(len(codes), dtype=np.int64)
+        for i in range(largeur):
+            voisinage = (chiffres[i - 1] * k + chiffres[i]) * k + chiffres[(i + 1) % largeur]
+            suivant = suivant * k + table[voisinage]
+        successeurs[codes[0]:codes[-1] + 1] = suivant
+
+    return successeurs
+
+
+def _nombre_doublements(nombre_etats):
+    """
+    Nombre m de doublements tel que 2**m >= nombre_etats : au bout de 2**m pas,
+    toute configuration a forcément atteint son cycle.
+    """
+    return max(1, (nombre_etats - 1).bit_length())
+
+
+def analyse_bassins(successeurs):
+    """
+    Trouve les cycles (attracteurs) de l'application `successeurs` et la taille
+    de leur bassin d'attraction.
+
+    Plutôt que de suivre l'orbite de chaque configuration, on calcule f^(2^m)
+    par doublements successifs (f <- f∘f) : son image est exactement l'ensemble
+    des configurations situées sur un cycle, marquées dans un masque booléen.
+    Chaque cycle est ensuite représenté par son plus petit code.
+
+    Args:
+        successeurs (numpy.ndarray): Le résultat de calcule_successeurs.
+
+    Returns:
+        tuple: (attracteur, representants, longueurs, tailles) où
+            - attracteur[x] est le représentant du cycle atteint depuis x,
+            - representants est le tableau trié des représentants des cycles,
+            - longueurs[i] est la longueur du cycle representants[i],
+            - tailles[i] est le nombre de configurations de son bassin.
+    """
+    nombre_etats = len(successeurs)
+    saut = successeurs.copy()
+    for _ in range(_nombre_doublements(nombre_etats)):
+        saut = saut[saut]
+
+    # Masque des configurations appartenant à un cycle
+    sur_un_cycle = np.zeros(nombre_etats, dtype=bool)
+    sur_un_cycle[saut] = True
+    noeuds_cycle = np.flatnonzero(sur_un_cycle)
+
+    # Sur les cycles, on propage le minimum par doublements (indices compressés)
+    suivant = np.searchsorted(noeuds_cycle, successeurs[noeuds_cycle])
+    minimum = noeuds_cycle.copy()
+    for _ in range(_nombre_doublements(len(noeuds_cycle))):
+        minimum = np.minimum(minimum, minimum[suivant])
+        suivant = suivant[suivant]
+
+    attracteur = minimum[np.searchsorted(noeuds_cycle, saut)]
+    representants, longueurs = np.unique(minimum, return_counts=True)
+    tailles = np.bincount(np.searchsorted(representants, attracteur), minlength=len(representants))
+
+    return attracteur, representants, longueurs, tailles
+
+
+def apparition_symbole(automate, largeur, symbole, successeurs=None, taille_lot=1 << 20):
+    """
+    Répond, pour tous les mots w de largeur donnée à la fois, à la question
+    HALTING-CELLULAR-AUTOMATON restreinte au tore : le symbole apparaît-il dans
+    une configuration de l'orbite de w ?
+
+    Args:
+        automate (Automate_cellulaire): L'automate à étudier.
+        largeur (int): Le nombre de cellules du tore.
+        symbole (str): Le symbole recherché.
+        successeurs (numpy.ndarray, optional): Le résultat de calcule_successeurs
+            s'il est déjà calculé.
+        taille_lot (int, optional): Nombre de configurations traitées à la fois.
+
+    Returns:
+        numpy.ndarray: Tableau booléen indexé par le code du mot w.
+    """
+    symboles = symboles_ordonnes(automate)
+    if symbole not in symboles:
+        raise ValueError(f"Le symbole {symbole!r} n'appartient pas à l'espace d'états de l'automate")
+    if successeurs is None:
+        successeurs = calcule_successeurs(automate, largeur, taille_lot)
+
+    k = len(symboles)
+    chiffre = symboles.index(symbole)
+    nombre_etats = len(successeurs)
+
+    # Configurations contenant directement le symbole
+    apparait = np.zeros(nombre_etats, dtype=bool)
+    for codes in _lots(nombre_etats, taille_lot):
+        present = np.zeros(len(codes), dtype=bool)
+        for chiffres_cellule in _chiffres(codes, largeur, k):
+            present |= chiffres_cellule == chiffre
+        apparait[codes[0]:codes[-1] + 1] = present
+
+    # Après le tour j, apparait[x] couvre les 2^j premières configurations de l'orbite de x
+    saut = successeurs.copy()
+    for _ in range(_nombre_doublements(nombre_etats)):
+        apparait |= apparait[saut]
+        saut = saut[saut]
+
+    return apparait
@@ -1,57 +1,135 @@
 from structure_données import Automate_cellulaire, Configuration, MachineTuring, ConfigurationTuring
 from itertools import product
+import os
+import timeit
+
+
+TAILLE_BLOC = 1 << 20  # nombre d'octets lus à la fois dans les fichiers de règles
+
+
+def _blocs(fichier):
+    """
+    Lit le fichier par blocs d'environ TAILLE_BLOC octets.
+    Chaque bloc est une liste de lignes complètes.
+    """
+    while True:
+        bloc = fichier.readlines(TAILLE_BLOC)
+        if not bloc:
+            return
+        yield bloc
+
+
+def _erreur_de_lecture(chemin_acces, lignes_lues, bloc, ligne, message):
+    """
+    Construit l'erreur signalée pour une ligne mal formée. Le numéro de ligne n'est
+    calculé qu'ici, pour ne pas ralentir la lecture des fichiers corrects.
+    """
+    position = next(i for i, l in enumerate(bloc) if l is ligne)
+    return ValueError(f"{chemin_acces}, ligne {lignes_lues + position + 1} : {message} ({ligne.strip()!r})")
+
+
+def automate_elementaire(numero, mot_entre, symbol_vide='0'):
+    """
+    Construit l'automate cellulaire élémentaire de numéro de Wolfram donné,
+    sans lire de fichier (spécification « rule:110 » de lecture_automate).
+
+    Le bit 4*g + 2*c + d du numéro donne le nouvel état de la cellule centrale
+    pour le voisinage (g, c, d).
+
+    Args:
+        numero (int or str): Le numéro de la règle, entre 0 et 255.
+        mot_entre (str): Le mot de la configuration initiale.
+        symbol_vide (str, optional): Le symbole vide ('0' ou '1').
+
+    Returns:
+        Automate_cellulaire: L'automate élémentaire initialisé avec le mot.
+    """
+    try:
+        numero = int(numero)
+    except ValueError:
+        raise ValueError(f"Numéro de règle invalide : {numero!r}") from None
+    if not 0 <= numero <= 255:
+        raise ValueError(f"Le numéro d'une règle élémentaire est compris entre 0 et 255 (reçu : {numero})")
+    if symbol_vide not in ('0', '1'):
+        raise ValueError(f"Le symbole vide d'un automate élémentaire est '0' ou '1' (reçu : {symbol_vide!r})")
+
+    fonction_transition = {
+        (g, c, d): str((numero >> (4 * int(g) + 2 * int(c) + int(d))) & 1)
+        for g, c, d in product('01', repeat=3)
+    }
+
+    automate = Automate_cellulaire(
+        espace_etat={'0', '1'},
+        fonction_transition=fonction_transition,
+        symbol_vide=symbol_vide
+    )
+    automate.configuration = Configuration(list(mot_entre), symbol_vide=symbol_vide)
+
+    return automate
 
 
 def lecture_automate(chemin_acces, mot_entre, symbol_vide):
-    transitions_brutes = []  # stocke temporairement les transitions à traiter
-    espace_etat = set()      # ensemble des états
+    """
+    Lit un automate cellulaire depuis un fichier de règles « g c d -> r »,
+    où '*' remplace n'importe quel symbole, et l'initialise avec le mot donné.
+    Une règle écrite plus bas dans le fichier remplace les précédentes.
+
+    Le fichier est lu en une seule passe, par blocs, et les symboles sont
+    internés au fur et à mesure. Une spécification « rule:N » construit
+    directement l'automate élémentaire de numéro N (voir automate_elementaire).
+
+    Raises:
+        ValueError: Si une ligne est mal formée (le numéro de ligne est indiqué).
+    """
+    if chemin_acces.startswith("rule:"):
+        return automate_elementaire(chemin_acces[len("rule:"):], mot_entre, symbol_vide)
+
+    symboles = {}         # symboles internés : chaque symbole lu est remplacé par la première occurrence
+    segment = {}          # transitions sans '*' lues depuis le dernier paterne générique
+    segments = [segment]
+    generiques = []       # paternes contenant '*', dans l'ordre du fichier
+    lignes_lues = 0
 
-    # Première passe : collecter tous les états
     with open(chemin_acces, 'r') as fichier:
-        for ligne in fichier:
-            if '->' not in ligne:
-                continue
-
-            lhs, rhs = ligne.strip().split('->')
-            paterne = tuple(s.strip() for s in lhs.strip().split())
-            resultat = rhs.strip()
-
-            # Stocke la ligne pour la deuxième passe
-            transitions_brutes.append((paterne, resultat))
-
-            # Met à jour l’ensemble des symboles
-            espace_etat.update(s for s in paterne if s != '*')
-            espace_etat.add(resultat)
-
-    def extension_paterne(paterne):
-        """
-        Développe un modèle de transition (paterne) en remplaçant les caractères '*' 
-        par tous les symboles possibles dans l'ensemble d'états (espace_etat).
-        
-        Cette fonction génère toutes les combinaisons possibles où '*' est remplacé 
-        par tous les éléments de `espace_etat`.
-
-        Args:
-            paterne (tuple): Le modèle de transition contenant des symboles (ex : ('*', '0', '*'))
-
-        Returns:
-            list: Une liste de tuples représentant toutes les combinaisons possibles du modèle après expansion.
-        """
-
-        # Crée une liste de sous-listes où '*' est remplacé par une liste contenant tous les symboles de espace_etat
-        slots = [
-            [x] if x != '*' else list(espace_etat)
-            for x in paterne
-        ]
-
-        # Retourne toutes les combinaisons possibles des sous-listes en utilisant `itertools.product`
-        return list(product(*slots))
-
-    # Deuxième passe : création de la fonction de transition
-    fonction_transition = {}
-    for paterne, resultat in transitions_brutes:
-        for extension in extension_paterne(paterne):
+        for bloc in _blocs(fichier):
+            try:
+                for ligne in bloc:
+                    lhs, fleche, rhs = ligne.partition('->')
+                    if not fleche:
+                        continue
+
+                    gauche, centre, droite = lhs.split()
+                    resultat, = rhs.split()
+
+                    # Interne les symboles et met à jour l’ensemble des symboles
+                    paterne = (symboles.setdefault(gauche, gauche),
+                               symboles.setdefault(centre, centre),
+                               symboles.setdefault(droite, droite))
+                    resultat = symboles.setdefault(resultat, resultat)
+
+                    if '*' in paterne:
+                        # Les règles suivantes devront être appliquées après l'expansion de celle-ci
+                        generiques.append((paterne, resultat))
+                        segment = {}
+                        segments.append(segment)
+                    else:
+                        segment[paterne] = resultat
+            except ValueError:
+                raise _erreur_de_lecture(chemin_acces, lignes_lues, bloc, ligne,
+                                         "transition mal formée, attendu « g c d -> r »") from None
+            lignes_lues += len(bloc)
+
+    symboles.pop('*', None)
+    espace_etat = set(symboles)
+
+    # Création de la fonction de transition en respectant l'ordre du fichier
+    fonction_transition = segments[0]
+    for (paterne, resultat), segment in zip(generiques, segments[1:]):
+        # '*' est remplacé par tous les symboles possibles de espace_etat
+        slots = [[x] if x != '*' else list(espace_etat) for x in paterne]
+        for extension in product(*slots):
             fonction_transition[extension] = resultat
+        fonction_transition.update(segment)
 
     # Création de l’automate avec config initiale
     automate = Automate_cellulaire(
@@ -66,6 +144,96 @@ def lecture_automate(chemin_acces, mot_entre, symbol_vide):
     return automate
 
 
+def _lire_entete(ligne, entete):
+    """
+    Interprète une ligne de commentaire « # initial: q0 », « # accept: ... »
+    ou « # reject: ... » d'un fichier de machine de Turing.
+    """
+    if "initial:" in ligne:
+        entete["initial"] = ligne.split("initial:")[1].strip()
+    elif "accept:" in ligne:
+        entete["accept"].update(ligne.split("accept:")[1].strip().split())
+    elif "reject:" in ligne:
+        entete["reject"].update(ligne.split("reject:")[1].strip().split())
+
+
+def _lire_transitions_turing(fichier, chemin_acces, entete, etats, symboles):
+    """
+    Lit les transitions « état_courant symbole_lu -> nouvel_état symbole_écrit direction ».
+    """
+    transitions = {}
+    lignes_lues = 0
+    for bloc in _blocs(fichier):
+        try:
+            for brute in bloc:
+                gauche, fleche, droite = brute.partition("->")
+                if not fleche or ("#" in gauche and gauche.lstrip().startswith("#")):
+                    # Gérer les commentaires pour les infos supplémentaires
+                    ligne = brute.strip()
+                    if not ligne or ligne.startswith("#"):
+                        _lire_entete(ligne, entete)
+                    continue
+
+                etat_courant, symbole_lu = gauche.split()
+                nouvel_etat, symbole_ecrit, direction = droite.split()
+
+                # Interne les états et les symboles en les collectant
+                etat_courant = etats.setdefault(etat_courant, etat_courant)
+                nouvel_etat = etats.setdefault(nouvel_etat, nouvel_etat)
+                symbole_lu = symboles.setdefault(symbole_lu, symbole_lu)
+                symbole_ecrit = symboles.setdefault(symbole_ecrit, symbole_ecrit)
+                transitions[(etat_courant, symbole_lu)] = (nouvel_etat, symbole_ecrit, direction)
+        except ValueError:
+            raise _erreur_de_lecture(chemin_acces, lignes_lues, bloc, brute,
+                                     "transition mal formée, attendu « q s -> q' s' D »") from None
+        lignes_lues += len(bloc)
+    return transitions
+
+
+def _lire_table_turing(fichier, chemin_acces, entete, etats, symboles):
+    """
+    Lit une machine de Turing au format tableau (CSV) : une ligne d'en-tête
+    « etat,s1,s2,... » puis une ligne par état, dont chaque case contient
+    « nouvel_état symbole_écrit direction » ou est vide s'il n'y a pas de transition.
+    Exemple : q0,q1 0 D,q0 1 D,q_accept □ D
+    """
+    transitions = {}
+    colonnes = None
+    lignes_lues = 0
+    for bloc in _blocs(fichier):
+        try:
+            for brute in bloc:
+                ligne = brute.strip()
+                if not ligne or ligne.startswith("#"):
+                    _lire_entete(ligne, entete)
+                    continue
+
+                cases = ligne.split(",")
+                if colonnes is None:
+                    colonnes = [s.strip() for s in cases[1:]]
+                    continue
+                if len(cases) != len(colonnes) + 1:
+                    raise ValueError
+
+                etat_courant = cases[0].strip()
+                for symbole_lu, case in zip(colonnes, cases[1:]):
+                    if not case or case.isspace():
+                        continue
+                    nouvel_etat, symbole_ecrit, direction = case.split()
+
+                    # Interne les états et les symboles en les collectant
+                    etat_courant = etats.setdefault(etat_courant, etat_courant)
+                    nouvel_etat = etats.setdefault(nouvel_etat, nouvel_etat)
+                    symbole_lu = symboles.setdefault(symbole_lu, symbole_lu)
+                    symbole_ecrit = symboles.setdefault(symbole_ecrit, symbole_ecrit)
+                    transitions[(etat_courant, symbole_lu)] = (nouvel_etat, symbole_ecrit, direction)
+        except ValueError:
+            raise _erreur_de_lecture(chemin_acces, lignes_lues, bloc, brute,
+                                     "ligne du tableau mal formée, attendu « etat,q' s' D,... »") from None
+        lignes_lues += len(bloc)
+    return transitions
+
+
 def lire_machine_turing(fichier: str, mot: str) -> MachineTuring:
     """
     Lit une machine de Turing depuis un fichier et initialise la configuration
@@ -79,43 +247,24 @@ def lire_machine_turing(fichier: str, mot: str) -> MachineTuring:
     Chaque transition est décrite sous la forme :
     état_courant symbole_lu -> nouvel_état symbole_écrit direction
     Exemple : q0 1 -> q1 0 R
+
+    Un fichier .csv décrit les transitions sous forme de tableau (voir _lire_table_turing).
+    Les états et les symboles sont collectés pendant l'unique lecture du fichier.
     """
-    transitions = {}
-    etat_initial = None
-    etats_accept = set()
-    etats_reject = set()
+    entete = {"initial": None, "accept": set(), "reject": set()}
+    etats = {}     # états internés, collectés pendant la lecture
+    symboles = {}  # symboles internés, collectés pendant la lecture
 
+    lecteur = _lire_table_turing if fichier.endswith(".csv") else _lire_transitions_turing
     with open(fichier, "r") as f:
-        for ligne in f:
-            ligne = ligne.strip()
-            if not ligne or ligne.startswith("#"):
-                # Gérer les commentaires pour les infos supplémentaires
-                if "initial:" in ligne:
-                    etat_initial = ligne.split("initial:")[1].strip()
-                elif "accept:" in ligne:
-                    etats_accept.update(ligne.split("accept:")[1].strip().split())
-                elif "reject:" in ligne:
-                    etats_reject.update(ligne.split("reject:")[1].strip().split())
-                continue
-
-            # Parser une transition
-            if "->" in ligne:
-                gauche, droite = ligne.split("->")
-                etat_courant, symbole_lu = gauche.strip().split()
-                nouvel_etat, symbole_ecrit, direction = droite.strip().split()
-                transitions[(etat_courant, symbole_lu)] = (nouvel_etat, symbole_ecrit, direction)
+        transitions = lecteur(f, fichier, entete, etats, symboles)
 
+    etat_initial = entete["initial"]
     if etat_initial is None:
         raise ValueError("État initial non défini dans le fichier (ligne avec '# initial: ...')")
 
-    # Récupération de tous les états et symboles vus dans les transitions
-    etats = set()
-    symboles = set()
-    for (etat_courant, symbole_lu), (etat_suivant, symbole_ecrit, _) in transitions.items():
-        etats.add(etat_courant)
-        etats.add(etat_suivant)
-        symboles.add(symbole_lu)
-        symboles.add(symbole_ecrit)
+    etats = set(etats)
+    symboles = set(symboles)
 
     # Ajouter le symbole blanc si pas déjà dedans
     symboles.add('□')
@@ -132,7 +281,7 @@ def lire_machine_turing(fichier: str, mot: str) -> MachineTuring:
         etats=etats,
         symboles=symboles,
         etat_initial=etat_initial,
-        etats_acceptation=etats_accept,
+        etats_acceptation=entete["accept"],
         transitions=transitions,
         configuration=config_init
     )
@@ -140,6 +289,27 @@ def lire_machine_turing(fichier: str, mot: str) -> MachineTuring:
     return machine
 
 
+def mesure_debit(chemin_acces, repetitions=5):
+    """
+    Mesure le débit du chargeur, en lignes lues par seconde, sur un fichier
+    de règles (meilleur temps sur plusieurs lectures).
+    Les fichiers MT/MA et .csv sont lus comme des machines de Turing.
+    """
+    with open(chemin_acces, 'r') as fichier:
+        nombre_lignes = sum(len(bloc) for bloc in _blocs(fichier))
+
+    nom = os.path.basename(chemin_acces)
+    if nom.startswith(("MT", "MA")) or nom.endswith(".csv"):
+        def charger():
+            lire_machine_turing(chemin_acces, "")
+    else:
+        def charger():
+            lecture_automate(chemin_acces, "", "0")
+
+    meilleur = min(timeit.repeat(charger, number=1, repeat=repetitions))
+    return nombre_lignes / meilleur
+
+
 def construire_automate_depuis_turing(machine_turing):
     """
     Cette fonction construit un automate cellulaire à partir d'une machine de Turing donnée.
@@ -5,6 +5,8 @@ from sys import argv
 if __name__ == "__main__":
     nom_fichier = argv[1]
     mode = argv[1][0:2]
+    if nom_fichier.startswith("rule:"):
+        mode = "AC"  # automate élémentaire donné par son numéro de Wolfram (ex : rule:110)
     mot = argv[2]
     vide = argv[3]
     pas_maximale = int(argv[4])
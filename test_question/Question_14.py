@@ -1,5 +1,21 @@
-from importation import code
+import os
+from importation import code, lecture_automate
+from espace_des_phases import symboles_ordonnes, decoder_configuration, calcule_successeurs, analyse_bassins, apparition_symbole
 if __name__ == '__main__':
     print("Question 14 : Soit le probl`eme HALTING-CELLULAR-AUTOMATON : ´etant donn´e < A > le coded’un automate cellulaire, s ∈ S et un mot w ∈ S∗, d´ecider si A sur l’entr´ee w va avoir une configurat")
     print("\n\nRéponse : Voici la réponse halting_cellular_automaton : \n")
     code(14)
+
+    # Sur un tore de largeur fixée, l'espace des configurations est fini : le problème devient décidable
+    largeur = 12
+    chemin = os.path.join(os.path.dirname(__file__), "..", "AC_interessant_1.txt")
+    automate = lecture_automate(chemin, "0", "0")
+    symboles = symboles_ordonnes(automate)
+    successeurs = calcule_successeurs(automate, largeur)
+    attracteur, representants, longueurs, tailles = analyse_bassins(successeurs)
+    print(f"\n\nExemple empirique : AC_interessant_1.txt sur un tore de largeur {largeur}")
+    print(f"{len(representants)} attracteurs pour {len(successeurs)} configurations :")
+    for representant, longueur, taille in zip(representants, longueurs, tailles):
+        print(f"  cycle de {''.join(decoder_configuration(int(representant), largeur, symboles))} : longueur {longueur}, bassin de {taille} configurations")
+    apparait = apparition_symbole(automate, largeur, "1", successeurs)
+    print(f"Le symbole 1 apparaît depuis {int(apparait.sum())} mots sur {len(apparait)}.")